@@ -43,6 +43,7 @@ struct VisionConfig {
     uint32_t batch_size = 1;
     bool use_fp16 = true;
     bool use_int8 = false;
+    std::string int8_calibration_cache = "./models/yolov11x_card_detector.calib";
     int dla_core = -1;
     uint32_t max_workspace_size_mb = 4096;
     bool enable_cuda_graphs = true;
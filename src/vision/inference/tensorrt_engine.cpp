@@ -3,6 +3,7 @@
 #include <algorithm>
 #include <iostream>
 #include <cassert>
+#include <iterator>
 
 namespace vision {
 
@@ -16,7 +17,7 @@ void TRTLogger::log(Severity severity, const char* msg) noexcept {
             logger.error("[TensorRT] {}", msg);
             break;
         case Severity::kWARNING:
-            logger.warn("[TensorRT] {}", msg);
+            logger.warning("[TensorRT] {}", msg);
             break;
         case Severity::kINFO:
             logger.info("[TensorRT] {}", msg);
@@ -27,6 +28,34 @@ void TRTLogger::log(Severity severity, const char* msg) noexcept {
     }
 }
 
+// INT8 Calibrator Implementation
+Int8CacheCalibrator::Int8CacheCalibrator(const std::string& cachePath, int32_t batchSize)
+    : m_cachePath(cachePath)
+    , m_batchSize(batchSize) {
+    // Read the cache once up front so the builder can check it before enabling INT8
+    std::ifstream file(m_cachePath, std::ios::binary);
+    if (file.good()) {
+        m_cache.assign(std::istreambuf_iterator<char>(file),
+                       std::istreambuf_iterator<char>());
+    }
+}
+
+bool Int8CacheCalibrator::getBatch(void* /*bindings*/[], const char* /*names*/[],
+                                   int32_t /*nbBindings*/) noexcept {
+    // All scales come from the cache; this calibrator never supplies batches
+    return false;
+}
+
+const void* Int8CacheCalibrator::readCalibrationCache(size_t& length) noexcept {
+    length = m_cache.size();
+    return length ? m_cache.data() : nullptr;
+}
+
+void Int8CacheCalibrator::writeCalibrationCache(const void* cache, size_t length) noexcept {
+    std::ofstream file(m_cachePath, std::ios::binary);
+    file.write(static_cast<const char*>(cache), length);
+}
+
 // Constructor
 TensorRTEngine::TensorRTEngine(const core::VisionConfig& config)
     : m_config(config)
@@ -60,8 +89,6 @@ TensorRTEngine::TensorRTEngine(const core::VisionConfig& config)
 TensorRTEngine::~TensorRTEngine() {
     deallocateBuffers();
 
-    if (m_cudaGraphExec) cudaGraphExecDestroy(m_cudaGraphExec);
-    if (m_cudaGraph) cudaGraphDestroy(m_cudaGraph);
     if (m_startEvent) cudaEventDestroy(m_startEvent);
     if (m_endEvent) cudaEventDestroy(m_endEvent);
     if (m_stream) cudaStreamDestroy(m_stream);
@@ -198,11 +225,21 @@ bool TensorRTEngine::buildEngineFromOnnx(const std::string& onnxPath) {
         logger.info("FP16 mode enabled");
     }
 
-    // Enable INT8 if requested
+    // Enable INT8 if requested (requires a calibration cache for valid scales)
+    std::unique_ptr<Int8CacheCalibrator> calibrator;
     if (m_config.use_int8 && builder->platformHasFastInt8()) {
-        config->setFlag(nvinfer1::BuilderFlag::kINT8);
-        logger.info("INT8 mode enabled");
-        // Note: INT8 calibration would be needed here for best results
+        calibrator = std::make_unique<Int8CacheCalibrator>(
+            m_config.int8_calibration_cache, static_cast<int32_t>(m_batchSize));
+        if (calibrator->hasCache()) {
+            config->setFlag(nvinfer1::BuilderFlag::kINT8);
+            config->setInt8Calibrator(calibrator.get());
+            logger.info("INT8 mode enabled (calibration cache: {})",
+                        m_config.int8_calibration_cache);
+        } else {
+            logger.warning("INT8 requested but calibration cache is missing or empty: {}; "
+                           "building without INT8", m_config.int8_calibration_cache);
+            calibrator.reset();
+        }
     }
 
     // Enable TF32 for Ampere and newer
@@ -288,6 +325,9 @@ bool TensorRTEngine::allocateBuffers() {
     auto& logger = utils::Logger::getInstance();
     logger.info("Allocating inference buffers");
 
+    // Release buffers from a previous build/load before reallocating
+    deallocateBuffers();
+
     // Allocate device memory
     size_t inputBytes = m_inputSize * sizeof(float);
     size_t outputBytes = m_outputSize * sizeof(float);
@@ -304,11 +344,18 @@ bool TensorRTEngine::allocateBuffers() {
     if (status != cudaSuccess) {
         logger.error("Failed to allocate output buffer: {}", cudaGetErrorString(status));
         cudaFree(m_deviceInputBuffer);
+        m_deviceInputBuffer = nullptr;
         return false;
     }
 
-    // Allocate host memory
-    m_hostOutputBuffer.resize(m_outputSize);
+    // Allocate pinned host memory so the D2H copy is a direct DMA with no staging copy
+    status = cudaMallocHost(reinterpret_cast<void**>(&m_hostOutputBuffer), outputBytes);
+    if (status != cudaSuccess) {
+        logger.error("Failed to allocate pinned host buffer: {}", cudaGetErrorString(status));
+        m_hostOutputBuffer = nullptr;
+        deallocateBuffers();
+        return false;
+    }
 
     logger.info("Allocated {:.2f} MB for input buffer", inputBytes / (1024.0f * 1024.0f));
     logger.info("Allocated {:.2f} MB for output buffer", outputBytes / (1024.0f * 1024.0f));
@@ -326,7 +373,21 @@ void TensorRTEngine::deallocateBuffers() {
         cudaFree(m_deviceOutputBuffer);
         m_deviceOutputBuffer = nullptr;
     }
-    m_hostOutputBuffer.clear();
+    if (m_hostOutputBuffer) {
+        cudaFreeHost(m_hostOutputBuffer);
+        m_hostOutputBuffer = nullptr;
+    }
+
+    // The captured graph holds the old bindings; force a fresh capture
+    if (m_cudaGraphExec) {
+        cudaGraphExecDestroy(m_cudaGraphExec);
+        m_cudaGraphExec = nullptr;
+    }
+    if (m_cudaGraph) {
+        cudaGraphDestroy(m_cudaGraph);
+        m_cudaGraph = nullptr;
+    }
+    m_graphCaptured = false;
 }
 
 // Synchronous inference
@@ -379,7 +440,7 @@ bool TensorRTEngine::infer(const float* inputTensor,
     // Copy output to host
     size_t outputBytes = m_outputSize * sizeof(float);
     status = cudaMemcpyAsync(
-        m_hostOutputBuffer.data(), m_deviceOutputBuffer, outputBytes,
+        m_hostOutputBuffer, m_deviceOutputBuffer, outputBytes,
         cudaMemcpyDeviceToHost, m_stream);
 
     if (status != cudaSuccess) {
@@ -403,7 +464,7 @@ bool TensorRTEngine::infer(const float* inputTensor,
     m_inferenceCount++;
 
     // Parse output
-    parseYOLOv11Output(m_hostOutputBuffer.data(), detections,
+    parseYOLOv11Output(m_hostOutputBuffer, detections,
                       confThreshold, nmsThreshold);
 
     return true;
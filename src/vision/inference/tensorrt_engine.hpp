@@ -18,6 +18,25 @@ public:
     void log(Severity severity, const char* msg) noexcept override;
 };
 
+// INT8 calibrator backed by a pre-generated calibration cache
+// (e.g. from trtexec/polygraphy); supplies no batches of its own
+class Int8CacheCalibrator : public nvinfer1::IInt8EntropyCalibrator2 {
+public:
+    Int8CacheCalibrator(const std::string& cachePath, int32_t batchSize);
+
+    bool hasCache() const { return !m_cache.empty(); }
+
+    int32_t getBatchSize() const noexcept override { return m_batchSize; }
+    bool getBatch(void* bindings[], const char* names[], int32_t nbBindings) noexcept override;
+    const void* readCalibrationCache(size_t& length) noexcept override;
+    void writeCalibrationCache(const void* cache, size_t length) noexcept override;
+
+private:
+    std::string m_cachePath;
+    int32_t m_batchSize;
+    std::vector<char> m_cache;
+};
+
 // RAII wrapper for CUDA resources
 template<typename T>
 struct CUDADeleter {
@@ -95,7 +114,7 @@ private:
     // Buffers
     void* m_deviceInputBuffer{nullptr};
     void* m_deviceOutputBuffer{nullptr};
-    std::vector<float> m_hostOutputBuffer;
+    float* m_hostOutputBuffer{nullptr};  // Pinned: D2H copy DMAs directly, no staging copy
 
     // Model configuration
     const core::VisionConfig& m_config;